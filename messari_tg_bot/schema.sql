@@ -3,3 +3,25 @@ CREATE TABLE IF NOT EXISTS processed_items (
     type TEXT NOT NULL,
     published_at TEXT
 );
+
+CREATE INDEX IF NOT EXISTS idx_processed_items_published_at ON processed_items(published_at);
+
+CREATE TABLE IF NOT EXISTS translation_cache (
+    sha256 TEXT PRIMARY KEY,
+    translated TEXT NOT NULL,
+    bullets TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS feed_meta (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    modified TEXT,
+    entries BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS article_cache (
+    url TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
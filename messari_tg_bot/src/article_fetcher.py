@@ -4,20 +4,32 @@ from typing import Optional
 from bs4 import BeautifulSoup
 import httpx
 
+from .storage import Storage
+
 logger = logging.getLogger(__name__)
 
 
 class ArticleFetcher:
     """Fetches full article content from URLs."""
 
-    def __init__(self):
+    def __init__(self, storage: Optional[Storage] = None, cache_ttl_seconds: float = 3600.0):
         self.timeout = 30.0
+        # Fetched articles are kept for an hour so URLs repeated across feeds or
+        # re-seen after a restart don't hit the network again.
+        self.storage = storage
+        self.cache_ttl_seconds = cache_ttl_seconds
 
     async def fetch_full_article(self, url: str) -> Optional[str]:
         """
         Fetch full article content from URL.
         Returns cleaned article text or None if failed.
         """
+        if self.storage:
+            cached = self.storage.get_article(url, self.cache_ttl_seconds)
+            if cached:
+                logger.info(f"Using cached article for {url} ({len(cached)} chars)")
+                return cached
+
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -41,6 +53,8 @@ class ArticleFetcher:
 
                     if article_text:
                         logger.info(f"Successfully fetched article from {url} ({len(article_text)} chars)")
+                        if self.storage:
+                            self.storage.save_article(url, article_text, self.cache_ttl_seconds)
                         return article_text
                     else:
                         logger.warning(f"No article content found at {url}")
@@ -1,8 +1,9 @@
 import os
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from dotenv import load_dotenv
 
@@ -46,8 +47,9 @@ HN_ACCEPTED_KEYWORDS = [
 ]
 
 
+@lru_cache(maxsize=64)
 def get_source_hashtag(url: str) -> str:
-    """Get hashtag for a source URL."""
+    """Get hashtag for a source URL (memoized: feed URLs repeat every poll)."""
     for source_domain, hashtag in SOURCE_HASHTAGS.items():
         if source_domain in url.lower():
             return hashtag
@@ -81,6 +83,7 @@ class Settings:
     poll_interval_minutes: int = 10
     bootstrap_lookback_hours: int = 24
     max_items_per_run: int = 20
+    max_concurrency: int = 4
     research_tags: List[str] = field(default_factory=list)
     newsletter_source_types: List[str] = field(default_factory=list)
     newsletter_source_ids: List[str] = field(default_factory=list)
@@ -89,6 +92,14 @@ class Settings:
     environment: str = "dev"
     hn_enabled: bool = False
     hn_max_stories: int = 5
+    state_db_path: str = ""  # defaults to messari_tg_bot/state.db
+    # Lowercased filter keywords, precomputed once for _passes_filters.
+    research_tags_lc: Tuple[str, ...] = field(init=False, repr=False)
+    newsletter_source_types_lc: Tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.research_tags_lc = tuple(tag.lower() for tag in self.research_tags)
+        self.newsletter_source_types_lc = tuple(tag.lower() for tag in self.newsletter_source_types)
 
 
 def _parse_csv(value: str) -> List[str]:
@@ -133,6 +144,7 @@ def load_settings() -> Settings:
         poll_interval_minutes=int(os.getenv("POLL_INTERVAL_MIN", "10")),
         bootstrap_lookback_hours=int(os.getenv("BOOTSTRAP_LOOKBACK_HOURS", "24")),
         max_items_per_run=int(os.getenv("MAX_ITEMS_PER_RUN", "20")),
+        max_concurrency=int(os.getenv("MAX_CONCURRENCY", "4")),
         research_tags=_parse_csv(os.getenv("RESEARCH_TAGS", "")),
         newsletter_source_types=_parse_csv(os.getenv("NEWSLETTER_SOURCE_TYPES", "")),
         newsletter_source_ids=_parse_csv(os.getenv("NEWSLETTER_SOURCE_IDS", "")),
@@ -141,6 +153,7 @@ def load_settings() -> Settings:
         environment=os.getenv("ENVIRONMENT", "dev"),
         hn_enabled=os.getenv("HN_ENABLED", "false").lower() in ("true", "1", "yes"),
         hn_max_stories=int(os.getenv("HN_MAX_STORIES", "5")),
+        state_db_path=os.getenv("STATE_DB_PATH", ""),
     )
 
 
@@ -3,6 +3,11 @@ import asyncio
 import logging
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - not available on Windows
+    uvloop = None
+
 from .article_fetcher import ArticleFetcher
 from .config import load_settings
 from .hn_client import HNClient
@@ -27,11 +32,12 @@ async def async_main() -> None:
     settings = load_settings()
 
     project_root = Path(__file__).resolve().parent.parent
-    db_path = project_root / "state.db"
+    db_path = Path(settings.state_db_path) if settings.state_db_path else project_root / "state.db"
 
     storage = Storage(db_path=db_path)
-    rss_client = RSSClient()
-    article_fetcher = ArticleFetcher()
+    feed_count = len(settings.research_feeds) + len(settings.newsletter_feeds)
+    rss_client = RSSClient(storage=storage, parse_workers=min(8, feed_count))
+    article_fetcher = ArticleFetcher(storage=storage)
     translator = Translator(
         mode=settings.translator_mode,
         openrouter_api_key=settings.openrouter_api_key,
@@ -56,11 +62,24 @@ async def async_main() -> None:
         hn_client=hn_client,
     )
 
-    if args.once:
-        await orchestrator.run_once()
+    try:
+        if args.once:
+            await orchestrator.run_once()
+        else:
+            await orchestrator.run_forever()
+    finally:
+        await rss_client.aclose()
+        await telegram_client.aclose()
+
+
+def main() -> None:
+    # uvloop's libuv-based loop speeds up the many small HTTPS requests per
+    # cycle; it isn't available on Windows, where the default loop is used.
+    if uvloop is not None:
+        uvloop.run(async_main())
     else:
-        await orchestrator.run_forever()
+        asyncio.run(async_main())
 
 
 if __name__ == "__main__":
-    asyncio.run(async_main())
+    main()
@@ -1,11 +1,15 @@
 import asyncio
+import hashlib
 import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Awaitable, Callable, Iterable, List, Optional, Set, Tuple
 import calendar
 from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 
 from .article_fetcher import ArticleFetcher
@@ -19,6 +23,9 @@ from .translator import Translator
 
 logger = logging.getLogger(__name__)
 
+# Entry key the parsed publish date is memoized under.
+_ENTRY_DATE_KEY = "_cached_dt"
+
 
 @dataclass
 class ProcessedItem:
@@ -33,7 +40,30 @@ class ProcessedItem:
     source_url: Optional[str] = None  # Source feed URL
 
 
+@dataclass
+class Candidate:
+    """A feed entry that passed filters and is waiting to be processed."""
+
+    entry_id: str
+    entry: dict
+    publish_date: Optional[datetime]
+    item_type: str  # research | newsletter
+    feed_url: str
+    hashtag: str
+
+
 class Orchestrator:
+    TLDR_HEADER = "\nTLDR (RU):\n"
+    ERROR_PATTERNS = (
+        "произошла ошибка при загрузке",
+        "необходимо перезагрузить страницу",
+        "для изменения настроек уведомлений требуется авторизация",
+        "error occurred",
+        "please refresh",
+        "authorization required",
+    )
+    _ERROR_RE = re.compile("|".join(map(re.escape, ERROR_PATTERNS)), re.IGNORECASE)
+
     def __init__(
         self,
         settings: Settings,
@@ -51,23 +81,19 @@ class Orchestrator:
         self.translator = translator
         self.telegram_client = telegram_client
         self.hn_client = hn_client
+        # Ids processed within the lookback window, loaded once per poll cycle.
+        self._processed_cache: Set[str] = set()
+        # Canonical URLs delivered from feeds this cycle, to skip HN cross-posts.
+        self._delivered_urls: Set[str] = set()
+        # Processed-item rows not yet written to storage.
+        self._pending_writes: List[Tuple[str, str, Optional[str]]] = []
 
     def _is_error_summary(self, bullets: List[str]) -> bool:
         """Check if bullets contain error messages."""
-        error_patterns = [
-            "произошла ошибка при загрузке",
-            "необходимо перезагрузить страницу",
-            "для изменения настроек уведомлений требуется авторизация",
-            "error occurred",
-            "please refresh",
-            "authorization required"
-        ]
-        
-        combined_text = " ".join(bullets).lower()
-        for pattern in error_patterns:
-            if pattern in combined_text:
-                logger.warning(f"Skipping item due to error pattern detected: {pattern}")
-                return True
+        match = self._ERROR_RE.search(" ".join(bullets))
+        if match:
+            logger.warning(f"Skipping item due to error pattern detected: {match.group(0)}")
+            return True
         return False
 
     async def run_forever(self) -> None:
@@ -77,172 +103,85 @@ class Orchestrator:
 
     async def run_once(self) -> None:
         logger.info("Starting poll cycle")
+        lookback = datetime.now(timezone.utc) - timedelta(hours=self.settings.bootstrap_lookback_hours)
+        self._processed_cache = self.storage.processed_ids_since(lookback.isoformat())
+        self._delivered_urls = set()
         remaining = self.settings.max_items_per_run
-        processed_total = 0
-
-        processed_research = await self._process_research(remaining)
-        processed_total += processed_research
-        remaining -= processed_research
-
-        if remaining > 0:
-            processed_news = await self._process_newsletters(remaining)
-            processed_total += processed_news
-            remaining -= processed_news
-
-        if remaining > 0 and self.hn_client and self.settings.hn_enabled:
-            processed_hn = await self._process_hacker_news(remaining)
-            processed_total += processed_hn
+        try:
+            # Both streams are fetched concurrently and processed as one batch;
+            # research goes first so it keeps priority within the item budget.
+            research, newsletters = await asyncio.gather(
+                self._stream_entries(
+                    "research", self.settings.research_feeds, self.settings.research_tags_lc, lookback
+                ),
+                self._stream_entries(
+                    "newsletter",
+                    self.settings.newsletter_feeds,
+                    self.settings.newsletter_source_types_lc,
+                    lookback,
+                ),
+            )
+            jobs = [partial(self._handle_entry, c) for c in self._select_unprocessed(research + newsletters)]
+            processed_total = await self._run_bounded(jobs, remaining)
+            remaining -= processed_total
+
+            if remaining > 0 and self.hn_client and self.settings.hn_enabled:
+                processed_hn = await self._process_hacker_news(remaining)
+                processed_total += processed_hn
+        finally:
+            self._flush_processed()
 
         logger.info("Poll cycle complete; processed %s items", processed_total)
 
-    async def _process_research(self, limit: int) -> int:
-        lookback = datetime.now(timezone.utc) - timedelta(hours=self.settings.bootstrap_lookback_hours)
-        processed_count = 0
+    async def _stream_entries(
+        self, item_type: str, feeds: List[str], keywords: Tuple[str, ...], lookback: datetime
+    ) -> List[Candidate]:
+        """Fetch a stream's feeds and return the entries passing its filters."""
+        candidates: List[Candidate] = []
+        entries_per_feed = await self._fetch_feeds(feeds, lookback)
 
-        for feed_url in self.settings.research_feeds:
-            if processed_count >= limit:
-                break
-            
-            entries = self._fetch_from_url(feed_url)
+        for feed_url, entries in zip(feeds, entries_per_feed):
             hashtag = get_source_hashtag(feed_url)
-            
-            for entry in entries:
-                if processed_count >= limit:
-                    break
-                if self.settings.research_tags and not self._passes_filters(
-                    entry, self.settings.research_tags
-                ):
-                    continue
-                publish_date = self._entry_date(entry)
-                if publish_date and publish_date < lookback:
-                    logger.debug("Skip (old): %s", entry.get("title"))
-                    continue
-
-                entry_id = entry.get("id") or entry.get("link") or entry.get("title")
-                if self.storage.is_processed(entry_id):
-                    continue
-
-                try:
-                    # Get URL for full article fetch
-                    url = entry.get("link") or ""
-
-                    # Try to fetch full article from URL
-                    full_article = None
-                    if url:
-                        logger.info(f"Fetching full article from {url}")
-                        full_article = await self.article_fetcher.fetch_full_article(url)
-
-                    # Fallback to RSS content if article fetch failed
-                    if not full_article:
-                        logger.info(f"Using RSS content for research: {entry.get('title')}")
-                        full_article = self._entry_content(entry)
-
-                    # Translate and summarize
-                    translated_full = await self.translator.translate_full_text(full_article)
-                    bullets = await self.translator.summarize_to_bullets(full_article)
-
-                    item = ProcessedItem(
-                        item_id=entry_id,
-                        slug=self._slug(entry),
-                        title=entry.get("title") or "Без названия",
-                        url=entry.get("link") or "",
-                        publish_date=publish_date or datetime.now(timezone.utc),
-                        content=translated_full,
-                        item_type="research",
-                        source_url=feed_url,
-                    )
-
-                    await self._deliver_item(item, bullets, hashtag)
-                    if not self.telegram_client.dry_run:
-                        self.storage.mark_processed(item.item_id, item.item_type, item.publish_date.isoformat())
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to process research entry '{entry.get('title')}': {e}", exc_info=True)
-                    continue
 
-        return processed_count
-
-    async def _process_newsletters(self, limit: int) -> int:
-        lookback = datetime.now(timezone.utc) - timedelta(hours=self.settings.bootstrap_lookback_hours)
-        processed_count = 0
-
-        for feed_url in self.settings.newsletter_feeds:
-            if processed_count >= limit:
-                break
-            
-            entries = self._fetch_from_url(feed_url)
-            hashtag = get_source_hashtag(feed_url)
-            
             for entry in entries:
-                if processed_count >= limit:
-                    break
-                if self.settings.newsletter_source_types and not self._passes_filters(
-                    entry, self.settings.newsletter_source_types
-                ):
-                    continue
+                # The date check is cheaper and rejects more than the keyword scan.
                 publish_date = self._entry_date(entry)
                 if publish_date and publish_date < lookback:
                     logger.debug("Skip (old): %s", entry.get("title"))
                     continue
+                if keywords and not self._passes_filters(entry, keywords):
+                    continue
 
                 entry_id = entry.get("id") or entry.get("link") or entry.get("title")
-                if self.storage.is_processed(entry_id):
-                    continue
+                candidates.append(
+                    Candidate(entry_id, entry, publish_date, item_type, feed_url, hashtag)
+                )
 
-                try:
-                    # Get URL for full article fetch
-                    url = entry.get("link") or ""
-
-                    # Try to fetch full article from URL
-                    full_article = None
-                    if url:
-                        logger.info(f"Fetching full article from {url}")
-                        full_article = await self.article_fetcher.fetch_full_article(url)
-
-                    # Fallback to RSS content if article fetch failed
-                    if not full_article:
-                        logger.info(f"Using RSS content for newsletter: {entry.get('title')}")
-                        full_article = self._entry_content(entry)
-
-                    # Translate and summarize
-                    translated_full = await self.translator.translate_full_text(full_article)
-                    bullets = await self.translator.summarize_to_bullets(full_article)
-
-                    item = ProcessedItem(
-                        item_id=entry_id,
-                        slug=self._slug(entry),
-                        title=entry.get("title") or "Без названия",
-                        url=entry.get("link") or "",
-                        publish_date=publish_date or datetime.now(timezone.utc),
-                        content=translated_full,
-                        item_type="newsletter",
-                        source_url=feed_url,
-                    )
-
-                    await self._deliver_item(item, bullets, hashtag)
-                    if not self.telegram_client.dry_run:
-                        self.storage.mark_processed(item.item_id, item.item_type, item.publish_date.isoformat())
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to process newsletter entry '{entry.get('title')}': {e}", exc_info=True)
-                    continue
+            self._log_latest_date(feed_url, entries)
 
-        return processed_count
+        return candidates
 
     async def _process_hacker_news(self, limit: int) -> int:
         if not self.hn_client:
             return 0
 
-        processed_count = 0
         stories = self.hn_client.fetch_newest_stories(limit)
         hashtag = get_source_hashtag("https://news.ycombinator.com/newest")
+        jobs: List[Callable[[], Awaitable[bool]]] = []
 
-        for story in stories:
-            if processed_count >= limit:
-                break
+        unprocessed = self._filter_unprocessed(f"hn_{story.id}" for story in stories)
 
+        for story in stories:
             entry_id = f"hn_{story.id}"
-            if self.storage.is_processed(entry_id):
+            if entry_id not in unprocessed:
+                continue
+
+            # Same article already posted from a feed this cycle; recorded as
+            # processed so it isn't picked up again next cycle.
+            if story.url and self._canon(story.url) in self._delivered_urls:
+                logger.info(f"Skipping HN story (already delivered from a feed): {story.title}")
+                publish_date = datetime.fromtimestamp(story.time, tz=timezone.utc)
+                self._record_processed(entry_id, "hn", publish_date.isoformat())
                 continue
 
             # Filter out non-AI/tech posts
@@ -250,53 +189,178 @@ class Orchestrator:
                 logger.info(f"Skipping HN story (filtered): {story.title}")
                 continue
 
-            try:
-                hn_url = f"https://news.ycombinator.com/item?id={story.id}"
-                url = story.url or hn_url
+            jobs.append(partial(self._handle_story, story, entry_id, hashtag))
 
-                full_article = None
-                if story.url:
-                    logger.info(f"Fetching full article from {url}")
-                    full_article = await self.article_fetcher.fetch_full_article(url)
+        return await self._run_bounded(jobs, limit)
 
-                if not full_article:
-                    full_article = story.title
+    def _select_unprocessed(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Drop entries repeated across feeds and those already processed.
 
-                translated_full = await self.translator.translate_full_text(full_article)
-                bullets = await self.translator.summarize_to_bullets(full_article)
+        Duplicates are detected by canonical link (see _canon); the processed
+        check is a single batched storage query.
+        """
+        seen = set()
+        unique: List[Candidate] = []
+        for candidate in candidates:
+            entry_id = candidate.entry_id
+            key = self._canon(candidate.entry.get("link") or "") or entry_id
+            if key in seen or entry_id in seen:
+                continue
+            seen.add(key)
+            seen.add(entry_id)
+            unique.append(candidate)
 
-                publish_date = datetime.fromtimestamp(story.time, tz=timezone.utc)
+        unprocessed = self._filter_unprocessed(c.entry_id for c in unique)
+        return [c for c in unique if c.entry_id in unprocessed]
 
-                item = ProcessedItem(
-                    item_id=entry_id,
-                    slug=f"hn_{story.id}",
-                    title=story.title or "Без названия",
-                    url=url,
-                    publish_date=publish_date,
-                    content=translated_full,
-                    item_type="hn",
-                    hn_url=hn_url,
-                    source_url="https://news.ycombinator.com/newest",
-                )
+    def _filter_unprocessed(self, item_ids: Iterable[str]) -> Set[str]:
+        # Ids already known from this cycle's cache never reach sqlite.
+        unknown = {item_id for item_id in item_ids if item_id not in self._processed_cache}
+        if not unknown:
+            return unknown
+        return self.storage.filter_unprocessed(unknown)
 
-                await self._deliver_item(item, bullets, hashtag)
-                if not self.telegram_client.dry_run:
-                    self.storage.mark_processed(item.item_id, item.item_type, item.publish_date.isoformat())
-                processed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to process HN story '{story.title}': {e}", exc_info=True)
-                continue
+    def _mark_processed(self, item: ProcessedItem) -> None:
+        self._record_processed(item.item_id, item.item_type, item.publish_date.isoformat())
 
+    def _record_processed(self, item_id: str, item_type: str, published_at: Optional[str]) -> None:
+        if self.telegram_client.dry_run:
+            return
+        # Written in one transaction per job batch (see _run_bounded); the
+        # in-memory cache keeps the rest of the batch consistent meanwhile.
+        self._pending_writes.append((item_id, item_type, published_at))
+        self._processed_cache.add(item_id)
+
+    def _flush_processed(self) -> None:
+        pending, self._pending_writes = self._pending_writes, []
+        self.storage.mark_processed_many(pending)
+
+    async def _run_bounded(self, jobs: List[Callable[[], Awaitable[bool]]], limit: int) -> int:
+        """Run item jobs concurrently, stopping once `limit` of them succeeded.
+
+        Jobs run in batches of at most `max_concurrency`, and never more than
+        the remaining budget, so the limit is never overshot; failed or skipped
+        jobs free their slot for the next batch. Processed ids are written
+        after every batch, so an abrupt stop (e.g. `docker stop`) can re-post
+        at most one batch.
+        """
+        concurrency = max(1, self.settings.max_concurrency)
+        processed_count = 0
+        pending = list(jobs)
+        while pending and processed_count < limit:
+            batch_size = min(concurrency, limit - processed_count)
+            batch, pending = pending[:batch_size], pending[batch_size:]
+            results = await asyncio.gather(*(job() for job in batch))
+            self._flush_processed()
+            processed_count += sum(1 for ok in results if ok)
         return processed_count
 
+    async def _handle_entry(self, candidate: Candidate) -> bool:
+        entry = candidate.entry
+        item_type = candidate.item_type
+        try:
+            # Get URL for full article fetch
+            url = entry.get("link") or ""
+
+            # Try to fetch full article from URL
+            full_article = None
+            if url:
+                logger.info(f"Fetching full article from {url}")
+                full_article = await self.article_fetcher.fetch_full_article(url)
+
+            # Fallback to RSS content if article fetch failed
+            if not full_article:
+                logger.info(f"Using RSS content for {item_type}: {entry.get('title')}")
+                full_article = self._entry_content(entry)
+
+            # Translate and summarize (reused if this exact article was seen before)
+            translated_full, bullets = await self._translate(full_article)
+
+            item = ProcessedItem(
+                item_id=candidate.entry_id,
+                slug=self._slug(entry),
+                title=entry.get("title") or "Без названия",
+                url=entry.get("link") or "",
+                publish_date=candidate.publish_date or datetime.now(timezone.utc),
+                content=translated_full,
+                item_type=item_type,
+                source_url=candidate.feed_url,
+            )
+
+            await self._deliver_item(item, bullets, candidate.hashtag)
+            if item.url:
+                self._delivered_urls.add(self._canon(item.url))
+            self._mark_processed(item)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to process {item_type} entry '{entry.get('title')}': {e}", exc_info=True)
+            return False
+
+    async def _handle_story(self, story: HNStory, entry_id: str, hashtag: str) -> bool:
+        try:
+            hn_url = f"https://news.ycombinator.com/item?id={story.id}"
+            url = story.url or hn_url
+
+            full_article = None
+            if story.url:
+                logger.info(f"Fetching full article from {url}")
+                full_article = await self.article_fetcher.fetch_full_article(url)
+
+            if not full_article:
+                full_article = story.title
+
+            translated_full, bullets = await self._translate(full_article)
+
+            publish_date = datetime.fromtimestamp(story.time, tz=timezone.utc)
+
+            item = ProcessedItem(
+                item_id=entry_id,
+                slug=f"hn_{story.id}",
+                title=story.title or "Без названия",
+                url=url,
+                publish_date=publish_date,
+                content=translated_full,
+                item_type="hn",
+                hn_url=hn_url,
+                source_url="https://news.ycombinator.com/newest",
+            )
+
+            await self._deliver_item(item, bullets, hashtag)
+            self._mark_processed(item)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to process HN story '{story.title}': {e}", exc_info=True)
+            return False
+
+    async def _translate(self, full_article: str) -> Tuple[str, List[str]]:
+        key = self._translation_key(full_article)
+        # Entries older than the lookback are never processed, so neither is
+        # there a reason to keep their translations around for longer.
+        max_age_seconds = self.settings.bootstrap_lookback_hours * 3600
+        cached = self.storage.get_translation(key, max_age_seconds)
+        if cached is not None:
+            logger.info("Translation cache hit for %s", key[:12])
+            return cached
+
+        translated_full, bullets = await self.translator.translate_and_summarize(full_article)
+        self.storage.save_translation(key, translated_full, bullets, max_age_seconds)
+        return translated_full, bullets
+
+    def _translation_key(self, full_article: str) -> str:
+        # Mode and models are part of the key so switching them doesn't serve stale output.
+        translator = self.translator
+        material = "\0".join(
+            (translator.mode, translator.translate_model, translator.tldr_model, full_article)
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
     async def _deliver_item(self, item: ProcessedItem, bullets: List[str], hashtag: str) -> None:
         # Check for error patterns in summary
         if self._is_error_summary(bullets):
             logger.info(f"Skipping item '{item.title}' due to error summary")
             return
 
-        bullet_lines = "\n".join(f"- {bullet}" for bullet in bullets[:7])
-        message = f"{hashtag}\nTLDR (RU):\n{bullet_lines}"
+        message = hashtag + self.TLDR_HEADER + "\n".join(["- " + bullet for bullet in bullets[:7]])
         
         # Add URLs
         if item.item_type == "hn" and item.hn_url and item.hn_url != item.url:
@@ -304,35 +368,70 @@ class Orchestrator:
         else:
             message += f"\n\nOriginal: {item.url}"
 
-        # Send to chat
-        await self.telegram_client.send_text(message, to_channel=False)
-
-        # Send to channel if configured
+        # Send to chat, and to the channel if configured, concurrently
+        targets = ["chat"]
+        sends = [self.telegram_client.send_text(message, to_channel=False)]
         if self.settings.telegram_channel_id:
-            await self.telegram_client.send_text(message, to_channel=True)
+            targets.append("channel")
+            sends.append(self.telegram_client.send_text(message, to_channel=True))
+        results = await asyncio.gather(*sends, return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+        # Delivered to at least one target: the item counts as processed, so a
+        # failed chat send never causes a repost to the public channel.
+        for target, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to send '{item.title}' to {target}: {result}")
 
     @staticmethod
     def _entry_date(entry: dict) -> Optional[datetime]:
+        # Memoized on the entry itself: the date is needed by several passes.
+        if _ENTRY_DATE_KEY in entry:
+            return entry[_ENTRY_DATE_KEY]
+        publish_date = None
         try:
-            if "published_parsed" in entry and entry["published_parsed"]:
-                return datetime.fromtimestamp(calendar.timegm(entry.published_parsed), tz=timezone.utc)
-            if "updated_parsed" in entry and entry["updated_parsed"]:
-                return datetime.fromtimestamp(calendar.timegm(entry.updated_parsed), tz=timezone.utc)
-            if "published" in entry and entry["published"]:
-                return parsedate_to_datetime(entry["published"]).astimezone(timezone.utc)
-            if "updated" in entry and entry["updated"]:
-                return parsedate_to_datetime(entry["updated"]).astimezone(timezone.utc)
+            parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            if parsed:
+                publish_date = datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
+            else:
+                raw = entry.get("published") or entry.get("updated")
+                if raw:
+                    publish_date = Orchestrator._parse_date_string(raw)
         except Exception:
             logger.warning("Failed to parse date for entry: %s", entry.get("title"))
-        return None
+        entry[_ENTRY_DATE_KEY] = publish_date
+        return publish_date
+
+    @staticmethod
+    def _parse_date_string(raw: str) -> datetime:
+        # Atom/JSON feeds use ISO 8601, which the C-implemented fromisoformat
+        # handles directly; RSS uses RFC 822 and needs the email.utils parser.
+        try:
+            parsed = datetime.fromisoformat(raw.strip())
+        except ValueError:
+            parsed = parsedate_to_datetime(raw)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
+    @staticmethod
+    def _canon(url: str) -> str:
+        """Canonical form of a URL for duplicate detection.
+
+        Drops the scheme, fragment, trailing slash and utm_* tracking
+        parameters, and lowercases the host.
+        """
+        parts = urlsplit(url.strip())
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        query = urlencode([(k, v) for k, v in params if not k.lower().startswith("utm_")])
+        canonical = parts.netloc.lower() + parts.path.rstrip("/")
+        return f"{canonical}?{query}" if query else canonical
 
     @staticmethod
     def _entry_content(entry: dict) -> str:
-        if "content" in entry and entry["content"]:
-            content_list = entry["content"]
-            if isinstance(content_list, list) and content_list:
-                return content_list[0].get("value", "") or ""
-        return entry.get("summary") or entry.get("description") or ""
+        return entry.get("content_value") or entry.get("summary") or entry.get("description") or ""
 
     @staticmethod
     def _slug(entry: dict) -> str:
@@ -343,42 +442,39 @@ class Orchestrator:
         return title[:80] or "item"
 
     @staticmethod
-    def _passes_filters(entry: dict, keywords: List[str]) -> bool:
+    def _passes_filters(entry: dict, keywords: Tuple[str, ...]) -> bool:
+        """`keywords` must already be lowercased (see Settings.*_lc)."""
         haystack = f"{entry.get('title','')} {entry.get('summary','')} {entry.get('description','')}".lower()
-        return any(keyword.lower() in haystack for keyword in keywords)
+        return any(keyword in haystack for keyword in keywords)
 
-    def _fetch_from_url(self, url: str) -> List[dict]:
-        try:
-            entries = self.rss_client.fetch_entries(url)
-            if not entries:
+    def _log_latest_date(self, url: str, entries: List[dict]) -> None:
+        if not entries:
+            return
+        # Usually already memoized by the processing pass.
+        first_date = self._entry_date(entries[0])
+        logger.info(
+            "Feed %s latest date: %s",
+            url,
+            first_date.isoformat() if first_date else "unknown",
+        )
+
+    async def _fetch_feeds(self, urls: List[str], lookback: datetime) -> List[List[dict]]:
+        """Download all feeds concurrently; a failed feed yields no entries."""
+        results = await asyncio.gather(
+            *(self.rss_client.fetch_entries(url, since=lookback) for url in urls),
+            return_exceptions=True,
+        )
+        entries_per_feed: List[List[dict]] = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to fetch feed %s", url, exc_info=result)
+                entries_per_feed.append([])
+                continue
+            if result is None:
+                # Quiet feed, skipped by RSSClient as not updated within the lookback.
+                entries_per_feed.append([])
+                continue
+            if not result:
                 logger.warning("Feed %s returned 0 entries", url)
-            else:
-                first_date = self._entry_date(entries[0])
-                logger.info(
-                    "Feed %s latest date: %s",
-                    url,
-                    first_date.isoformat() if first_date else "unknown",
-                )
-            return entries
-        except Exception:
-            logger.exception("Failed to fetch feed %s", url)
-            return []
-
-    def _fetch_from_urls(self, urls: List[str]) -> List[dict]:
-        items: List[dict] = []
-        for url in urls:
-            try:
-                entries = self.rss_client.fetch_entries(url)
-                items.extend(entries)
-                if not entries:
-                    logger.warning("Feed %s returned 0 entries", url)
-                else:
-                    first_date = self._entry_date(entries[0])
-                    logger.info(
-                        "Feed %s latest date: %s",
-                        url,
-                        first_date.isoformat() if first_date else "unknown",
-                    )
-            except Exception:
-                logger.exception("Failed to fetch feed %s", url)
-        return items
+            entries_per_feed.append(result)
+        return entries_per_feed
@@ -1,33 +1,127 @@
+import asyncio
+import calendar
 import logging
+import pickle
 import ssl
-import urllib.request
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from typing import Dict, List, Optional
 
 import certifi
 import feedparser
+import httpx
+
+from .storage import Storage
 
 logger = logging.getLogger(__name__)
 
 
+def _slim_entry(entry: Dict) -> Dict:
+    """Project a FeedParserDict onto a plain dict with just the fields we use.
+
+    Lookups on FeedParserDict go through its key-aliasing machinery; a plain
+    dict keeps the per-entry hot path cheap and the pickled snapshot small.
+    Fields the feed doesn't have are left out (as on FeedParserDict), so
+    `.get(key, default)` keeps returning the default rather than None.
+    """
+    content = entry.get("content") or [{}]
+    projection = {
+        "id": entry.get("id"),
+        "link": entry.get("link"),
+        "title": entry.get("title"),
+        "summary": entry.get("summary"),
+        "description": entry.get("description"),
+        "content_value": content[0].get("value", ""),
+        "published": entry.get("published"),
+        "published_parsed": entry.get("published_parsed"),
+    }
+    # FeedParserDict aliases a missing "updated" to "published" (with a
+    # DeprecationWarning); only copy it when the feed really has it.
+    if "updated" in entry:
+        projection["updated"] = entry.get("updated")
+        projection["updated_parsed"] = entry.get("updated_parsed")
+    return {key: value for key, value in projection.items() if value is not None}
+
+
 class RSSClient:
-    def __init__(self) -> None:
+    def __init__(self, storage: Optional[Storage] = None, parse_workers: int = 4) -> None:
+        # When set, ETag/Last-Modified validators and the last entries are kept
+        # per feed so unchanged feeds are answered with 304 and not re-parsed.
+        self.storage = storage
         self.ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self.handlers = [urllib.request.HTTPSHandler(context=self.ssl_context)]
-
-    def fetch_entries(self, url: str) -> List[Dict]:
-        parsed = feedparser.parse(
-            url,
-            request_headers={
+        # Shared pooled client so concurrent feed downloads reuse connections.
+        self.client = httpx.AsyncClient(
+            verify=self.ssl_context,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+            headers={
                 "User-Agent": "Mozilla/5.0 (feed-fetcher; +https://github.com/kurtmckee/feedparser)"
             },
-            handlers=self.handlers,
         )
-        entries = parsed.get("entries", [])
-        status = parsed.get("status")
+        # feedparser is CPU-bound pure Python; parsing on a bounded pool keeps
+        # the event loop free for concurrent downloads and translator calls.
+        self.parse_executor = ThreadPoolExecutor(
+            max_workers=max(1, parse_workers), thread_name_prefix="feedparser"
+        )
+
+    async def fetch_entries(self, url: str, since: Optional[datetime] = None) -> Optional[List[Dict]]:
+        """Fetch and parse a feed.
+
+        If `since` is given and the feed itself reports being last updated
+        before it, None is returned without looking at the entries, so callers
+        can tell a quiet feed from an empty or broken one.
+        """
+        meta = self.storage.get_feed_meta(url) if self.storage else None
+        headers = {}
+        if meta and meta.etag:
+            headers["If-None-Match"] = meta.etag
+        if meta and meta.modified:
+            headers["If-Modified-Since"] = meta.modified
+
+        response = await self.client.get(url, headers=headers)
+        if response.status_code == 304 and meta:
+            # Unchanged since last poll: reuse the snapshot so entries left over
+            # by max_items_per_run are still picked up.
+            entries = pickle.loads(meta.entries)
+            logger.info("Feed %s not modified: %s cached entries", url, len(entries))
+            return entries
+        if response.status_code >= 400:
+            logger.warning("Feed %s returned status %s", url, response.status_code)
+            return []
+
+        # Parsing raw bytes skips feedparser's own (blocking) urllib fetch. The
+        # response headers carry the charset, and Content-Location gives the
+        # base URI for resolving relative links, as a URL fetch would have.
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+        response_headers["content-location"] = str(response.url)
+        parse = partial(feedparser.parse, response.content, response_headers=response_headers)
+        loop = asyncio.get_running_loop()
+        parsed = await loop.run_in_executor(self.parse_executor, parse)
+        entries = [_slim_entry(entry) for entry in parsed.get("entries", [])]
         bozo = getattr(parsed, "bozo", False)
-        if status and status >= 400:
-            logger.warning("Feed %s returned status %s", url, status)
         if bozo:
             logger.warning("Feed %s bozo=%s error=%s", url, bozo, getattr(parsed, "bozo_exception", None))
         logger.info("Feed %s: %s entries", url, len(entries))
+
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if self.storage and (etag or modified):
+            self.storage.set_feed_meta(url, etag, modified, pickle.dumps(entries, protocol=5))
+        elif meta:
+            # The feed stopped sending validators: drop the old ones so a later
+            # 304 can't be answered with an outdated snapshot.
+            self.storage.delete_feed_meta(url)
+
+        feed_updated = parsed.get("feed", {}).get("updated_parsed")
+        if since and feed_updated:
+            updated_at = datetime.fromtimestamp(calendar.timegm(feed_updated), tz=timezone.utc)
+            if updated_at < since:
+                logger.info("Feed %s not updated since %s; skipping", url, since.isoformat())
+                return None
         return entries
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+        self.parse_executor.shutdown(wait=False)
@@ -1,6 +1,9 @@
+import json
 import sqlite3
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS processed_items (
@@ -8,9 +11,38 @@ CREATE TABLE IF NOT EXISTS processed_items (
     type TEXT NOT NULL,
     published_at TEXT
 );
+
+CREATE INDEX IF NOT EXISTS idx_processed_items_published_at ON processed_items(published_at);
+
+CREATE TABLE IF NOT EXISTS translation_cache (
+    sha256 TEXT PRIMARY KEY,
+    translated TEXT NOT NULL,
+    bullets TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS feed_meta (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    modified TEXT,
+    entries BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS article_cache (
+    url TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
 """
 
 
+@dataclass
+class FeedMeta:
+    etag: Optional[str]
+    modified: Optional[str]
+    entries: bytes  # pickled entries snapshot served on 304 Not Modified
+
+
 class Storage:
     def __init__(self, db_path: Path):
         self.db_path = db_path
@@ -19,12 +51,23 @@ class Storage:
     def _get_conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Safe under WAL (only the last commits may be lost on power failure)
+        # and avoids an fsync on every commit.
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     def _ensure_schema(self) -> None:
         conn = self._get_conn()
         try:
+            # WAL is persistent in the db file and lets readers run alongside a writer.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(SCHEMA)
+            # Databases created before translation_cache rows were timestamped.
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(translation_cache)")}
+            if "created_at" not in columns:
+                conn.execute(
+                    "ALTER TABLE translation_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+                )
             conn.commit()
         finally:
             conn.close()
@@ -37,6 +80,34 @@ class Storage:
         finally:
             conn.close()
 
+    def filter_unprocessed(self, item_ids: Iterable[str], chunk_size: int = 500) -> Set[str]:
+        """Return the subset of `item_ids` that has not been processed yet."""
+        pending = set(item_ids)
+        ids = list(pending)
+        conn = self._get_conn()
+        try:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur = conn.execute(
+                    f"SELECT id FROM processed_items WHERE id IN ({placeholders})", chunk
+                )
+                pending.difference_update(row["id"] for row in cur)
+            return pending
+        finally:
+            conn.close()
+
+    def processed_ids_since(self, published_after: str) -> Set[str]:
+        """Ids of processed items published at or after the given ISO timestamp."""
+        conn = self._get_conn()
+        try:
+            cur = conn.execute(
+                "SELECT id FROM processed_items WHERE published_at >= ?", (published_after,)
+            )
+            return {row["id"] for row in cur}
+        finally:
+            conn.close()
+
     def mark_processed(self, item_id: str, item_type: str, published_at: Optional[str]) -> None:
         conn = self._get_conn()
         try:
@@ -47,3 +118,104 @@ class Storage:
             conn.commit()
         finally:
             conn.close()
+
+    def mark_processed_many(self, items: List[Tuple[str, str, Optional[str]]]) -> None:
+        """Record (item_id, item_type, published_at) rows in a single transaction."""
+        if not items:
+            return
+        conn = self._get_conn()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO processed_items (id, type, published_at) VALUES (?, ?, ?)",
+                    items,
+                )
+        finally:
+            conn.close()
+
+    def get_translation(self, sha256: str, max_age_seconds: float) -> Optional[Tuple[str, List[str]]]:
+        conn = self._get_conn()
+        try:
+            cur = conn.execute(
+                "SELECT translated, bullets FROM translation_cache WHERE sha256 = ? AND created_at >= ?",
+                (sha256, time.time() - max_age_seconds),
+            )
+            row = cur.fetchone()
+            if row is None:
+                return None
+            return row["translated"], json.loads(row["bullets"])
+        finally:
+            conn.close()
+
+    def save_translation(
+        self, sha256: str, translated: str, bullets: List[str], max_age_seconds: float
+    ) -> None:
+        now = time.time()
+        conn = self._get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO translation_cache (sha256, translated, bullets, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (sha256, translated, json.dumps(bullets, ensure_ascii=False), now),
+            )
+            # Expired translations are never served again; drop them to keep the db small.
+            conn.execute("DELETE FROM translation_cache WHERE created_at < ?", (now - max_age_seconds,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_feed_meta(self, url: str) -> Optional[FeedMeta]:
+        conn = self._get_conn()
+        try:
+            cur = conn.execute("SELECT etag, modified, entries FROM feed_meta WHERE url = ?", (url,))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            return FeedMeta(etag=row["etag"], modified=row["modified"], entries=row["entries"])
+        finally:
+            conn.close()
+
+    def set_feed_meta(self, url: str, etag: Optional[str], modified: Optional[str], entries: bytes) -> None:
+        conn = self._get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_meta (url, etag, modified, entries) VALUES (?, ?, ?, ?)",
+                (url, etag, modified, entries),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete_feed_meta(self, url: str) -> None:
+        conn = self._get_conn()
+        try:
+            conn.execute("DELETE FROM feed_meta WHERE url = ?", (url,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_article(self, url: str, max_age_seconds: float) -> Optional[str]:
+        conn = self._get_conn()
+        try:
+            cur = conn.execute(
+                "SELECT body FROM article_cache WHERE url = ? AND fetched_at >= ?",
+                (url, time.time() - max_age_seconds),
+            )
+            row = cur.fetchone()
+            return row["body"] if row else None
+        finally:
+            conn.close()
+
+    def save_article(self, url: str, body: str, max_age_seconds: float) -> None:
+        now = time.time()
+        conn = self._get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO article_cache (url, body, fetched_at) VALUES (?, ?, ?)",
+                (url, body, now),
+            )
+            # Expired bodies are never served again; drop them to keep the db small.
+            conn.execute("DELETE FROM article_cache WHERE fetched_at < ?", (now - max_age_seconds,))
+            conn.commit()
+        finally:
+            conn.close()
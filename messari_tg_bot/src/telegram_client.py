@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import telegram
 from telegram.error import NetworkError, TimedOut
@@ -10,11 +10,48 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramClient:
-    def __init__(self, bot_token: str, chat_id: str, channel_id: Optional[str] = None, dry_run: bool = False):
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        channel_id: Optional[str] = None,
+        dry_run: bool = False,
+        min_send_interval: float = 1.0,
+    ):
         self.bot = telegram.Bot(bot_token)
         self.chat_id = chat_id
         self.channel_id = channel_id
         self.dry_run = dry_run
+        # Items are delivered concurrently, so the bot is initialized once and
+        # shared instead of being opened/closed around every request.
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+        # Telegram asks for at most ~1 message per second per chat; sends to the
+        # same chat are spaced out, sends to different chats proceed in parallel.
+        self.min_send_interval = min_send_interval
+        self._chat_locks: Dict[str, asyncio.Lock] = {}
+        self._last_sent: Dict[str, float] = {}
+
+    async def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                await self.bot.initialize()
+                self._initialized = True
+
+    async def _throttle(self, target_id: str) -> None:
+        loop = asyncio.get_running_loop()
+        lock = self._chat_locks.setdefault(target_id, asyncio.Lock())
+        async with lock:
+            wait = self._last_sent.get(target_id, 0.0) + self.min_send_interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_sent[target_id] = loop.time()
+
+    async def aclose(self) -> None:
+        await self.bot.shutdown()
+        self._initialized = False
 
     async def send_text(self, text: str, to_channel: bool = False) -> None:
         target_id = self.channel_id if to_channel and self.channel_id else self.chat_id
@@ -25,8 +62,9 @@ class TelegramClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with self.bot:
-                    await self.bot.send_message(chat_id=target_id, text=text)
+                await self._ensure_initialized()
+                await self._throttle(target_id)
+                await self.bot.send_message(chat_id=target_id, text=text)
                 return
             except (NetworkError, TimedOut) as e:
                 if attempt < max_retries - 1:
@@ -49,9 +87,10 @@ class TelegramClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with self.bot:
-                    with file_path.open("rb") as f:
-                        await self.bot.send_document(chat_id=target_id, document=f)
+                await self._ensure_initialized()
+                await self._throttle(target_id)
+                with file_path.open("rb") as f:
+                    await self.bot.send_document(chat_id=target_id, document=f)
                 return
             except (NetworkError, TimedOut) as e:
                 if attempt < max_retries - 1:
@@ -1,12 +1,25 @@
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Kept byte-identical across requests so the provider can reuse the cached prompt prefix.
+COMBINED_SYSTEM_PROMPT = (
+    "You are a professional translator and editor. For the article in the user message, "
+    "produce a JSON object with exactly two keys and nothing else:\n"
+    '"translation": the full text translated to Russian language ONLY. Preserve the meaning '
+    "and structure. Use neutral business tone.\n"
+    '"tldr": a list of {min_bullets}-{max_bullets} ultra-short bullet points in Russian language ONLY. '
+    "Each bullet must be ONLY ONE short sentence (maximum 10-15 words). Focus only on the main "
+    "point, no details. Skip disclaimers, legal notices, advertisements. Just the key facts.\n"
+    "Output ONLY the JSON object."
+)
+
 
 @dataclass
 class Translator:
@@ -14,6 +27,8 @@ class Translator:
     openrouter_api_key: str = ""
     translate_model: str = "mistralai/mixtral-8x7b-instruct"
     tldr_model: str = "mistralai/mixtral-8x7b-instruct"
+    # Combined calls whose reply was unusable and fell back to two separate calls.
+    combined_fallbacks: int = field(default=0, init=False)
 
     async def translate_full_text(self, text: str, target_language: str = "ru") -> str:
         if self.mode == "dev":
@@ -52,13 +67,72 @@ class Translator:
         response = await self._call_openrouter(
             model=self.tldr_model, system=prompt, user=text, usage_include=True
         )
-        bullets = [line.strip(" -•\t") for line in response.split("\n") if line.strip()]
+        return self._normalize_bullets(response.split("\n"), min_bullets, max_bullets)
+
+    async def translate_and_summarize(
+        self,
+        text: str,
+        target_language: str = "ru",
+        min_bullets: int = 3,
+        max_bullets: int = 7,
+    ) -> Tuple[str, List[str]]:
+        """Translate and summarize `text`, in a single LLM call when possible.
+
+        Both tasks are packed into one JSON-producing request when they use the
+        same model; otherwise (or if the reply isn't valid JSON) the two
+        dedicated calls are made concurrently.
+        """
+        if self.mode != "dev" and self.translate_model == self.tldr_model:
+            response = await self._call_openrouter(
+                model=self.translate_model,
+                system=COMBINED_SYSTEM_PROMPT.format(min_bullets=min_bullets, max_bullets=max_bullets),
+                user=text,
+                usage_include=True,
+                response_format={"type": "json_object"},
+            )
+            try:
+                data = json.loads(self._strip_code_fence(response))
+                translated = data["translation"]
+                bullets = data["tldr"]
+                if not isinstance(translated, str) or not translated or not isinstance(bullets, list):
+                    raise ValueError("unexpected JSON shape")
+                return translated, self._normalize_bullets(map(str, bullets), min_bullets, max_bullets)
+            except (ValueError, KeyError, TypeError) as e:
+                self.combined_fallbacks += 1
+                logger.warning(
+                    f"Combined translate+summarize reply from {self.translate_model} unusable ({e}); "
+                    f"using separate calls ({self.combined_fallbacks} fallbacks so far)"
+                )
+
+        translated, bullets = await asyncio.gather(
+            self.translate_full_text(text, target_language),
+            self.summarize_to_bullets(text, target_language, min_bullets, max_bullets),
+        )
+        return translated, bullets
+
+    @staticmethod
+    def _normalize_bullets(lines: Iterable[str], min_bullets: int, max_bullets: int) -> List[str]:
+        bullets = [line.strip(" -•\t") for line in lines if line.strip()]
         if len(bullets) < min_bullets:
             bullets.extend(["(пусто)"] * (min_bullets - len(bullets)))
         return bullets[:max_bullets]
 
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        text = response.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            text = text.rsplit("```", 1)[0]
+        return text
+
     async def _call_openrouter(
-        self, *, model: str, system: Optional[str], user: str, usage_include: bool = False
+        self,
+        *,
+        model: str,
+        system: Optional[str],
+        user: str,
+        usage_include: bool = False,
+        response_format: Optional[dict] = None,
     ) -> str:
         if not self.openrouter_api_key:
             raise RuntimeError("OPENROUTER_API_KEY is required in prod translator mode.")
@@ -79,6 +153,8 @@ class Translator:
         }
         if usage_include:
             payload["usage"] = {"include": True}
+        if response_format:
+            payload["response_format"] = response_format
 
         # Retry logic for network issues
         max_retries = 3
@@ -0,0 +1,55 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from messari_tg_bot.src.article_fetcher import ArticleFetcher
+from messari_tg_bot.src.storage import Storage
+
+URL = "https://example.com/post"
+ARTICLE_HTML = (
+    "<html><body><nav>Menu</nav><article>"
+    "<p>Bitcoin rallied after the ETF approval was announced.</p>"
+    "</article></body></html>"
+)
+
+
+def _mock_http(monkeypatch, responses: list) -> list:
+    """Route ArticleFetcher's HTTP clients to canned responses; returns the requests made."""
+    requests: list = []
+    real_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    return requests
+
+
+def test_cached_article_is_served_without_network(tmp_path: Path, monkeypatch) -> None:
+    storage = Storage(tmp_path / "state.db")
+    requests = _mock_http(monkeypatch, [httpx.Response(200, text=ARTICLE_HTML)])
+    fetcher = ArticleFetcher(storage=storage)
+
+    first = asyncio.run(fetcher.fetch_full_article(URL))
+    second = asyncio.run(fetcher.fetch_full_article(URL))
+
+    assert first == "Bitcoin rallied after the ETF approval was announced."
+    assert second == first
+    assert len(requests) == 1
+
+
+def test_failed_fetch_is_not_cached(tmp_path: Path, monkeypatch) -> None:
+    storage = Storage(tmp_path / "state.db")
+    requests = _mock_http(
+        monkeypatch, [httpx.Response(500), httpx.Response(200, text=ARTICLE_HTML)]
+    )
+    fetcher = ArticleFetcher(storage=storage)
+
+    assert asyncio.run(fetcher.fetch_full_article(URL)) is None
+    assert storage.get_article(URL, fetcher.cache_ttl_seconds) is None
+    assert asyncio.run(fetcher.fetch_full_article(URL)) is not None
+    assert len(requests) == 2
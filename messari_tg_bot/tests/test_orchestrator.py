@@ -0,0 +1,207 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from messari_tg_bot.src.config import Settings
+from messari_tg_bot.src.hn_client import HNStory
+from messari_tg_bot.src.orchestrator import Orchestrator, ProcessedItem
+from messari_tg_bot.src.storage import Storage
+from messari_tg_bot.src.translator import Translator
+
+
+def test_error_summary_detects_patterns_case_insensitively() -> None:
+    orchestrator = Orchestrator.__new__(Orchestrator)
+
+    assert orchestrator._is_error_summary(["Всё хорошо", "ПРОИЗОШЛА ОШИБКА при загрузке"]) is True
+    assert orchestrator._is_error_summary(["Please Refresh the page"]) is True
+    assert orchestrator._is_error_summary(["Рынок вырос на 5%"]) is False
+
+
+def test_entry_date_parses_iso_and_rfc822_strings() -> None:
+    iso = Orchestrator._entry_date({"published": "2024-05-01T12:30:00+02:00"})
+    rfc822 = Orchestrator._entry_date({"updated": "Wed, 01 May 2024 10:30:00 GMT"})
+
+    assert iso == datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc)
+    assert rfc822 == iso
+
+
+def test_canon_normalizes_tracking_params_and_host() -> None:
+    canonical = Orchestrator._canon("https://Example.COM/post/?utm_source=hn&id=7#comments")
+
+    assert canonical == "example.com/post?id=7"
+    assert Orchestrator._canon("http://example.com/post") == "example.com/post"
+
+
+def test_run_bounded_flushes_processed_ids_after_each_batch() -> None:
+    class RecordingStorage:
+        def __init__(self) -> None:
+            self.writes: list = []
+
+        def mark_processed_many(self, items) -> None:
+            self.writes.append([item_id for item_id, _, _ in items])
+
+    orchestrator = Orchestrator.__new__(Orchestrator)
+    orchestrator.settings = Settings(telegram_bot_token="t", telegram_chat_id="c", max_concurrency=2)
+    orchestrator.storage = RecordingStorage()
+    orchestrator.telegram_client = SimpleNamespace(dry_run=False)
+    orchestrator._processed_cache = set()
+    orchestrator._pending_writes = []
+
+    def job(item_id: str):
+        async def run() -> bool:
+            orchestrator._record_processed(item_id, "research", None)
+            return True
+        return run
+
+    processed = asyncio.run(orchestrator._run_bounded([job("a"), job("b"), job("c")], limit=3))
+
+    assert processed == 3
+    assert orchestrator.storage.writes == [["a", "b"], ["c"]]
+
+
+def _delivery_orchestrator(failing_targets: set) -> Orchestrator:
+    class FlakyTelegram:
+        dry_run = False
+
+        def __init__(self) -> None:
+            self.sent: list = []
+
+        async def send_text(self, text: str, to_channel: bool = False) -> None:
+            target = "channel" if to_channel else "chat"
+            if target in failing_targets:
+                raise RuntimeError(f"{target} unavailable")
+            self.sent.append(target)
+
+    orchestrator = Orchestrator.__new__(Orchestrator)
+    orchestrator.settings = Settings(telegram_bot_token="t", telegram_chat_id="c", telegram_channel_id="@ch")
+    orchestrator.telegram_client = FlakyTelegram()
+    return orchestrator
+
+
+def _sample_item() -> ProcessedItem:
+    return ProcessedItem(
+        item_id="id-1",
+        slug="slug",
+        title="Title",
+        url="https://example.com/post",
+        publish_date=datetime.now(timezone.utc),
+        content="Перевод",
+        item_type="research",
+    )
+
+
+def test_deliver_item_succeeds_when_one_target_fails() -> None:
+    orchestrator = _delivery_orchestrator({"chat"})
+
+    asyncio.run(orchestrator._deliver_item(_sample_item(), ["Пункт"], "#Messari"))
+
+    assert orchestrator.telegram_client.sent == ["channel"]
+
+
+def test_deliver_item_raises_when_all_targets_fail() -> None:
+    orchestrator = _delivery_orchestrator({"chat", "channel"})
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(orchestrator._deliver_item(_sample_item(), ["Пункт"], "#Messari"))
+
+
+RESEARCH_FEED = "https://messari.io/rss/research"
+NEWSLETTER_FEED = "https://degencamp.substack.com/feed"
+
+
+def _entry(entry_id: str, link: str) -> dict:
+    return {"id": entry_id, "link": link, "title": entry_id, "summary": f"{entry_id} summary."}
+
+
+class FakeRSS:
+    def __init__(self, feeds: dict) -> None:
+        self.feeds = feeds
+
+    async def fetch_entries(self, url: str, since=None):
+        return [dict(entry) for entry in self.feeds.get(url, [])]
+
+
+class FakeFetcher:
+    async def fetch_full_article(self, url: str):
+        return None
+
+
+class FakeTelegram:
+    dry_run = False
+
+    def __init__(self) -> None:
+        self.sent: list = []
+
+    async def send_text(self, text: str, to_channel: bool = False) -> None:
+        self.sent.append(text.rsplit("Original: ", 1)[1])
+
+
+def _run_once_orchestrator(tmp_path: Path, feeds: dict, hn_client=None, **settings) -> Orchestrator:
+    settings = Settings(
+        telegram_bot_token="t",
+        telegram_chat_id="c",
+        research_feeds=[RESEARCH_FEED],
+        newsletter_feeds=[NEWSLETTER_FEED],
+        max_concurrency=1,
+        **settings,
+    )
+    return Orchestrator(
+        settings,
+        Storage(tmp_path / "state.db"),
+        FakeRSS(feeds),
+        FakeFetcher(),
+        Translator(mode="dev"),
+        FakeTelegram(),
+        hn_client,
+    )
+
+
+def test_run_once_dedupes_filters_processed_and_keeps_research_first(tmp_path: Path) -> None:
+    feeds = {
+        RESEARCH_FEED: [
+            _entry("r1", "https://example.com/a"),
+            _entry("r2", "https://example.com/b"),
+            _entry("r3", "https://example.com/c"),
+            _entry("r4", "https://example.com/d"),
+        ],
+        NEWSLETTER_FEED: [
+            # Same article as r1 behind a tracking link.
+            _entry("n1", "http://EXAMPLE.com/a/?utm_source=newsletter"),
+            # Same id as r2 under a different link.
+            _entry("r2", "https://example.com/b-mirror"),
+            _entry("n3", "https://example.com/e"),
+        ],
+    }
+    orchestrator = _run_once_orchestrator(tmp_path, feeds, max_items_per_run=3)
+    orchestrator.storage.mark_processed("r3", "research", None)
+
+    asyncio.run(orchestrator.run_once())
+
+    assert orchestrator.telegram_client.sent == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/d",
+    ]
+    assert orchestrator.storage.filter_unprocessed(["r1", "r2", "r4", "n1", "n3"]) == {"n1", "n3"}
+
+
+def test_run_once_skips_hn_story_already_delivered_from_a_feed(tmp_path: Path) -> None:
+    now = int(datetime.now(timezone.utc).timestamp())
+    stories = [
+        HNStory(1, "New AI model for crypto", "http://example.com/a?utm_source=hn", "u", now, 1, 1),
+        HNStory(2, "Python developer tooling", "https://example.com/hn-only", "u", now, 1, 1),
+    ]
+    hn_client = SimpleNamespace(fetch_newest_stories=lambda limit: stories)
+    feeds = {RESEARCH_FEED: [_entry("r1", "https://example.com/a")]}
+    orchestrator = _run_once_orchestrator(tmp_path, feeds, hn_client, max_items_per_run=5, hn_enabled=True)
+
+    asyncio.run(orchestrator.run_once())
+
+    sent = orchestrator.telegram_client.sent
+    assert len(sent) == 2
+    assert sent[0] == "https://example.com/a"
+    assert sent[1].startswith("https://example.com/hn-only\n")
+    assert orchestrator.storage.filter_unprocessed(["hn_1", "hn_2"]) == set()
@@ -0,0 +1,153 @@
+import asyncio
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+import feedparser
+import httpx
+
+from messari_tg_bot.src.orchestrator import Orchestrator
+from messari_tg_bot.src.rss_client import RSSClient, _slim_entry
+from messari_tg_bot.src.storage import Storage
+
+FEED_WITHOUT_SUMMARY = b"""<rss><channel><title>Feed</title>
+<item><title>Bitcoin weekly</title><link>https://example.com/btc</link></item>
+</channel></rss>"""
+
+STALE_FEED = b"""<rss><channel><title>Feed</title>
+<lastBuildDate>Mon, 01 Jan 2024 00:00:00 GMT</lastBuildDate>
+<item><title>Old post</title><link>https://example.com/old</link>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _client(handler, storage=None) -> RSSClient:
+    client = RSSClient(storage=storage)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def _fetch(client: RSSClient, url: str = "https://example.com/feed", **kwargs):
+    try:
+        return await client.fetch_entries(url, **kwargs)
+    finally:
+        await client.aclose()
+
+
+def test_slim_entry_omits_missing_fields() -> None:
+    entry = _slim_entry(feedparser.parse(FEED_WITHOUT_SUMMARY).entries[0])
+
+    assert entry["title"] == "Bitcoin weekly"
+    assert "summary" not in entry
+    assert "description" not in entry
+    # Missing fields must not leak into the keyword haystack as "None".
+    assert Orchestrator._passes_filters(entry, ("one",)) is False
+    assert Orchestrator._passes_filters(entry, ("bitcoin",)) is True
+
+
+def test_slim_entry_does_not_alias_updated_to_published() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        entry = _slim_entry(feedparser.parse(STALE_FEED).entries[0])
+
+    assert entry["published"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert "updated" not in entry
+    assert "updated_parsed" not in entry
+
+
+def test_fetch_entries_returns_none_for_feed_not_updated_since_cutoff() -> None:
+    client = _client(lambda request: httpx.Response(200, content=STALE_FEED))
+    since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert asyncio.run(_fetch(client, since=since)) is None
+
+
+def test_fetch_entries_returns_entries_without_cutoff() -> None:
+    client = _client(lambda request: httpx.Response(200, content=STALE_FEED))
+
+    entries = asyncio.run(_fetch(client))
+
+    assert [entry["title"] for entry in entries] == ["Old post"]
+
+
+FRESH_FEED = b"""<rss><channel><title>Feed</title>
+<item><title>Fresh post</title><link>https://example.com/fresh</link></item>
+</channel></rss>"""
+
+
+def test_fetch_entries_sends_validators_and_serves_snapshot_on_304(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=FRESH_FEED,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    first = asyncio.run(_fetch(_client(handler, storage)))
+    second = asyncio.run(_fetch(_client(handler, storage)))
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert requests[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert [entry["title"] for entry in second] == ["Fresh post"]
+    assert second == first
+
+
+def test_fetch_entries_skips_snapshot_without_validators(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    requests: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=FRESH_FEED)
+
+    asyncio.run(_fetch(_client(handler, storage)))
+    asyncio.run(_fetch(_client(handler, storage)))
+
+    assert storage.get_feed_meta("https://example.com/feed") is None
+    assert "If-None-Match" not in requests[1].headers
+    assert "If-Modified-Since" not in requests[1].headers
+
+
+def test_fetch_entries_drops_stale_validators_when_feed_stops_sending_them(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    requests: list = []
+    responses = [
+        httpx.Response(200, content=FRESH_FEED, headers={"ETag": '"v1"'}),
+        httpx.Response(200, content=FRESH_FEED),
+        httpx.Response(200, content=FRESH_FEED),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    for _ in range(3):
+        asyncio.run(_fetch(_client(handler, storage)))
+
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert storage.get_feed_meta("https://example.com/feed") is None
+    assert "If-None-Match" not in requests[2].headers
+
+
+def test_fetch_entries_resolves_relative_links_and_header_charset() -> None:
+    atom = (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Лента</title>'
+        '<entry><title>Привет</title><link href="/posts/1"/><id>1</id></entry></feed>'
+    ).encode("cp1251")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=atom, headers={"Content-Type": "application/atom+xml; charset=windows-1251"}
+        )
+
+    entries = asyncio.run(_fetch(_client(handler), url="https://host.example/feed.xml"))
+
+    assert entries[0]["link"] == "https://host.example/posts/1"
+    assert entries[0]["title"] == "Привет"
@@ -1,3 +1,4 @@
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -12,3 +13,102 @@ def test_storage_deduplicates(tmp_path: Path) -> None:
 
     storage.mark_processed(item_id, "research", datetime.now(timezone.utc).isoformat())
     assert storage.is_processed(item_id) is True
+
+
+def test_storage_translation_cache(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    assert storage.get_translation("deadbeef", max_age_seconds=3600) is None
+
+    storage.save_translation("deadbeef", "Перевод", ["Пункт 1", "Пункт 2"], max_age_seconds=3600)
+    assert storage.get_translation("deadbeef", max_age_seconds=3600) == ("Перевод", ["Пункт 1", "Пункт 2"])
+    assert storage.get_translation("deadbeef", max_age_seconds=-1) is None
+
+
+def test_storage_translation_cache_prunes_expired_rows(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    storage.save_translation("old", "Старое", ["Пункт"], max_age_seconds=3600)
+
+    # Saving with a negative max age expires every row written before it.
+    storage.save_translation("new", "Новое", ["Пункт"], max_age_seconds=-1)
+    conn = sqlite3.connect(tmp_path / "state.db")
+    try:
+        remaining = [row[0] for row in conn.execute("SELECT sha256 FROM translation_cache")]
+    finally:
+        conn.close()
+    assert remaining == []
+
+
+def test_storage_migrates_translation_cache_without_timestamp(tmp_path: Path) -> None:
+    db_path = tmp_path / "state.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE translation_cache (sha256 TEXT PRIMARY KEY, translated TEXT NOT NULL, bullets TEXT NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    storage = Storage(db_path)
+    storage.save_translation("abc", "Перевод", ["Пункт"], max_age_seconds=3600)
+    assert storage.get_translation("abc", max_age_seconds=3600) == ("Перевод", ["Пункт"])
+
+
+def test_storage_filter_unprocessed(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    storage.mark_processed("done", "research", None)
+
+    assert storage.filter_unprocessed(["done", "new-1", "new-2"]) == {"new-1", "new-2"}
+    assert storage.filter_unprocessed([]) == set()
+
+
+def test_storage_feed_meta_roundtrip(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    url = "https://example.com/feed"
+    assert storage.get_feed_meta(url) is None
+
+    storage.set_feed_meta(url, '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT", b"snapshot")
+    meta = storage.get_feed_meta(url)
+    assert meta is not None
+    assert meta.etag == '"abc"'
+    assert meta.modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert meta.entries == b"snapshot"
+
+
+def test_storage_processed_ids_since(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    storage.mark_processed("old", "research", "2024-01-01T00:00:00+00:00")
+    storage.mark_processed("new", "research", "2024-06-01T00:00:00+00:00")
+
+    assert storage.processed_ids_since("2024-03-01T00:00:00+00:00") == {"new"}
+
+
+def test_storage_processed_ids_since_uses_published_at_index(tmp_path: Path) -> None:
+    Storage(tmp_path / "state.db")
+    conn = sqlite3.connect(tmp_path / "state.db")
+    try:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM processed_items WHERE published_at >= ?", ("2024",)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert any("idx_processed_items_published_at" in row[-1] for row in plan)
+
+
+def test_storage_article_cache_expires(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    url = "https://example.com/post"
+    assert storage.get_article(url, max_age_seconds=3600) is None
+
+    storage.save_article(url, "Article body", max_age_seconds=3600)
+    assert storage.get_article(url, max_age_seconds=3600) == "Article body"
+    assert storage.get_article(url, max_age_seconds=-1) is None
+
+
+def test_storage_mark_processed_many(tmp_path: Path) -> None:
+    storage = Storage(tmp_path / "state.db")
+    published_at = datetime.now(timezone.utc).isoformat()
+    storage.mark_processed_many([("a", "research", published_at), ("b", "hn", published_at)])
+
+    assert storage.is_processed("a") is True
+    assert storage.is_processed("b") is True
+    assert storage.filter_unprocessed(["a", "b", "c"]) == {"c"}
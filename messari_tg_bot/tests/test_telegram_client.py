@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+from messari_tg_bot.src.telegram_client import TelegramClient
+
+
+def _client(min_send_interval: float = 0.05):
+    client = TelegramClient("123:token", chat_id="chat", channel_id="channel", min_send_interval=min_send_interval)
+    sent: list = []
+    inits: list = []
+
+    async def initialize() -> None:
+        inits.append(True)
+
+    async def send_message(*, chat_id, text) -> None:
+        sent.append((chat_id, asyncio.get_running_loop().time()))
+
+    client.bot = SimpleNamespace(initialize=initialize, send_message=send_message)
+    return client, sent, inits
+
+
+def test_sends_to_same_chat_are_spaced_out() -> None:
+    client, sent, _ = _client()
+
+    async def run() -> None:
+        await asyncio.gather(client.send_text("a"), client.send_text("b"))
+
+    asyncio.run(run())
+
+    assert [chat for chat, _ in sent] == ["chat", "chat"]
+    assert sent[1][1] - sent[0][1] >= 0.05
+
+
+def test_sends_to_different_chats_are_not_throttled_together() -> None:
+    client, sent, _ = _client(min_send_interval=1.0)
+
+    async def run() -> None:
+        await asyncio.gather(client.send_text("a"), client.send_text("b", to_channel=True))
+
+    asyncio.run(run())
+
+    assert sorted(chat for chat, _ in sent) == ["channel", "chat"]
+    assert abs(sent[1][1] - sent[0][1]) < 0.5
+
+
+def test_bot_is_initialized_once_across_sends() -> None:
+    client, sent, inits = _client(min_send_interval=0.0)
+
+    async def run() -> None:
+        await asyncio.gather(*(client.send_text(str(i), to_channel=i % 2 == 0) for i in range(4)))
+
+    asyncio.run(run())
+
+    assert len(sent) == 4
+    assert len(inits) == 1
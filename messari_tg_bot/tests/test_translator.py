@@ -0,0 +1,71 @@
+import asyncio
+from typing import List
+
+from messari_tg_bot.src.translator import Translator
+
+
+def _stubbed_translator(replies: List[str], **kwargs) -> Translator:
+    translator = Translator(mode="prod", openrouter_api_key="key", **kwargs)
+    translator.calls = []
+    translator.response_formats = []
+
+    async def fake_call(*, model, system, user, usage_include=False, response_format=None):
+        translator.calls.append(model)
+        translator.response_formats.append(response_format)
+        return replies.pop(0)
+
+    translator._call_openrouter = fake_call
+    return translator
+
+
+def test_translate_and_summarize_single_call_with_json() -> None:
+    translator = _stubbed_translator(['{"translation": "Привет", "tldr": ["- один", "два", "три"]}'])
+
+    result = asyncio.run(translator.translate_and_summarize("Hello"))
+
+    assert result == ("Привет", ["один", "два", "три"])
+    assert len(translator.calls) == 1
+    assert translator.response_formats == [{"type": "json_object"}]
+    assert translator.combined_fallbacks == 0
+
+
+def test_translate_and_summarize_strips_code_fence() -> None:
+    translator = _stubbed_translator(['```json\n{"translation": "Привет", "tldr": ["один"]}\n```'])
+
+    translated, bullets = asyncio.run(translator.translate_and_summarize("Hello"))
+
+    assert translated == "Привет"
+    assert bullets == ["один", "(пусто)", "(пусто)"]
+    assert len(translator.calls) == 1
+
+
+def test_translate_and_summarize_falls_back_on_malformed_json() -> None:
+    translator = _stubbed_translator(["not json at all", "Перевод", "- а\n- б\n- в"])
+
+    translated, bullets = asyncio.run(translator.translate_and_summarize("Hello"))
+
+    assert translated == "Перевод"
+    assert bullets == ["а", "б", "в"]
+    assert len(translator.calls) == 3
+    assert translator.combined_fallbacks == 1
+
+
+def test_translate_and_summarize_falls_back_on_wrong_json_shape() -> None:
+    translator = _stubbed_translator(['{"translation": "", "tldr": "нет"}', "Перевод", "- а\n- б\n- в"])
+
+    translated, _ = asyncio.run(translator.translate_and_summarize("Hello"))
+
+    assert translated == "Перевод"
+    assert len(translator.calls) == 3
+
+
+def test_translate_and_summarize_uses_separate_calls_for_different_models() -> None:
+    translator = _stubbed_translator(
+        ["Перевод", "- а\n- б\n- в"], translate_model="model-a", tldr_model="model-b"
+    )
+
+    translated, bullets = asyncio.run(translator.translate_and_summarize("Hello"))
+
+    assert translated == "Перевод"
+    assert bullets == ["а", "б", "в"]
+    assert sorted(translator.calls) == ["model-a", "model-b"]